@@ -4,12 +4,13 @@ Main entry point for cmdrdata-anthropic CLI commands
 """
 import sys
 
-from .cli_setup import main as setup_main
-
 
 def main():
     """Main CLI entry point"""
     if len(sys.argv) > 1 and sys.argv[1] == "setup":
+        # Imported here so the help path doesn't load the setup wizard
+        from .cli_setup import main as setup_main
+
         return setup_main()
     else:
         print("CmdrData Anthropic SDK")
@@ -2,17 +2,135 @@
 Auto-configuration support for CmdrData SDKs
 Loads API keys from multiple sources in priority order
 """
+import functools
 import json
 import os
+import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    # Fall back to the stdlib parser, which also accepts bytes
+    _json_loads = json.loads
+
+# Matches the CmdrData entries of a .env file in a single scan, capturing the
+# value without surrounding whitespace. Lines may end in \n, \r\n or a lone \r,
+# as with universal newlines ([^\S\r\n] is whitespace except line breaks)
+_ENV_RE = re.compile(
+    rb"(?<![^\r\n])(CMDRDATA_API_KEY|CMDRDATA_API_URL)="
+    rb"[^\S\r\n]*([^\r\n]*?)[^\S\r\n]*(?=[\r\n]|\Z)"
+)
+_ENV_KEYS = {b"CMDRDATA_API_KEY": "api_key", b"CMDRDATA_API_URL": "api_url"}
+
+
+# Config files consulted after environment variables, in priority order.
+# The home directory is resolved once at import; the other two stay relative
+# so they always follow the current working directory.
+_ENV_PATH = Path(".env")
+_HOME_CONFIG_PATH = Path.home() / ".cmdrdata" / "config.json"
+_PROJECT_CONFIG_PATH = Path(".cmdrdata.json")
+
+
+def _source_signature() -> Tuple[Any, ...]:
+    """
+    Cheap fingerprint of every config source: the relevant environment
+    variables, the working directory the relative paths resolve against,
+    plus (mtime_ns, size) of each config file, or None if missing
+    """
+    signature: List[Any] = [
+        os.environ.get("CMDRDATA_API_KEY"),
+        os.environ.get("CMDRDATA_API_URL"),
+    ]
+    if signature[0]:
+        # Files are never consulted when the key comes from the environment
+        return tuple(signature)
+    try:
+        signature.append(os.getcwd())
+    except OSError:
+        # The working directory was removed; the relative files are gone too
+        signature.append(None)
+    for path in (_ENV_PATH, _HOME_CONFIG_PATH, _PROJECT_CONFIG_PATH):
+        try:
+            stat = path.stat()
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _read_config() -> Dict[str, Any]:
+    """Resolve configuration from all sources without consulting the cache"""
+    config = {"api_key": None, "api_url": "https://api.cmdrdata.ai"}
+
+    # 1. Check environment variables (highest priority)
+    if api_url := os.environ.get("CMDRDATA_API_URL"):
+        config["api_url"] = api_url
+    if api_key := os.environ.get("CMDRDATA_API_KEY"):
+        config["api_key"] = api_key
+        return config
+
+    # 2. Check .env file in current directory
+    # Missing or unreadable files raise OSError, which is cheaper than exists()
+    try:
+        for match in _ENV_RE.finditer(_ENV_PATH.read_bytes()):
+            config[_ENV_KEYS[match.group(1)]] = match.group(2).decode()
+    except (OSError, ValueError):
+        pass
+
+    # 3. Check user home config (from CLI setup)
+    if not config["api_key"]:
+        try:
+            home_data = _json_loads(_HOME_CONFIG_PATH.read_bytes())
+            config["api_key"] = home_data.get("api_key")
+            if home_data.get("api_url"):
+                config["api_url"] = home_data.get("api_url", config["api_url"])
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    # 4. Check project-level config
+    if not config["api_key"]:
+        try:
+            project_data = _json_loads(_PROJECT_CONFIG_PATH.read_bytes())
+            config["api_key"] = project_data.get("api_key")
+            if project_data.get("api_url"):
+                config["api_url"] = project_data.get("api_url", config["api_url"])
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    return config
+
+
+@dataclass(frozen=True)
+class CmdrDataConfig:
+    """Resolved CmdrData configuration (immutable, so it is shared from the cache)"""
+
+    api_key: Optional[str]
+    api_url: str
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_config(signature: Tuple[Any, ...]) -> CmdrDataConfig:
+    """Resolve configuration once per distinct source signature"""
+    config = _read_config()
+    return CmdrDataConfig(api_key=config["api_key"], api_url=config["api_url"])
+
+
+def _cached_config() -> CmdrDataConfig:
+    """Return the cached configuration, re-reading it if any source changed"""
+    return _resolve_config(_source_signature())
 
 
 class AutoConfig:
     """Automatic configuration loader for CmdrData"""
 
     @staticmethod
-    def load_config() -> Dict[str, Any]:
+    def load_config() -> CmdrDataConfig:
         """
         Load CmdrData configuration from multiple sources:
         1. Environment variables (highest priority)
@@ -20,70 +138,27 @@ class AutoConfig:
         3. ~/.cmdrdata/config.json (from CLI setup)
         4. .cmdrdata.json in current directory
 
-        Returns dict with 'api_key' and 'api_url' keys
+        The resolved result is cached and only re-read when an environment
+        variable or one of the files changes (by mtime or size).
+
+        Returns a CmdrDataConfig with 'api_key' and 'api_url' attributes
         """
-        config = {"api_key": None, "api_url": "https://api.cmdrdata.ai"}
-
-        # 1. Check environment variables (highest priority)
-        if os.getenv("CMDRDATA_API_KEY"):
-            config["api_key"] = os.getenv("CMDRDATA_API_KEY")
-        if os.getenv("CMDRDATA_API_URL"):
-            config["api_url"] = os.getenv("CMDRDATA_API_URL")
-
-        # 2. Check .env file in current directory
-        env_file = Path(".env")
-        if env_file.exists() and not config["api_key"]:
-            try:
-                with open(env_file) as f:
-                    for line in f:
-                        if line.startswith("CMDRDATA_API_KEY="):
-                            config["api_key"] = line.split("=", 1)[1].strip()
-                        elif line.startswith("CMDRDATA_API_URL="):
-                            config["api_url"] = line.split("=", 1)[1].strip()
-            except:
-                pass
-
-        # 3. Check user home config (from CLI setup)
-        home_config = Path.home() / ".cmdrdata" / "config.json"
-        if home_config.exists() and not config["api_key"]:
-            try:
-                with open(home_config) as f:
-                    home_data = json.load(f)
-                    if not config["api_key"]:
-                        config["api_key"] = home_data.get("api_key")
-                    if home_data.get("api_url"):
-                        config["api_url"] = home_data.get("api_url", config["api_url"])
-            except:
-                pass
-
-        # 4. Check project-level config
-        project_config = Path(".cmdrdata.json")
-        if project_config.exists() and not config["api_key"]:
-            try:
-                with open(project_config) as f:
-                    project_data = json.load(f)
-                    if not config["api_key"]:
-                        config["api_key"] = project_data.get("api_key")
-                    if project_data.get("api_url"):
-                        config["api_url"] = project_data.get(
-                            "api_url", config["api_url"]
-                        )
-            except:
-                pass
+        return _cached_config()
 
-        return config
+    @staticmethod
+    def refresh_cache() -> None:
+        """Discard the cached configuration so the next lookup re-reads it"""
+        _resolve_config.cache_clear()
 
     @staticmethod
     def get_api_key() -> Optional[str]:
         """Get the CmdrData API key from any configured source"""
-        config = AutoConfig.load_config()
-        return config.get("api_key")
+        return _cached_config().api_key
 
     @staticmethod
     def get_api_url() -> str:
         """Get the CmdrData API URL (defaults to production)"""
-        config = AutoConfig.load_config()
-        return config.get("api_url", "https://api.cmdrdata.ai")
+        return _cached_config().api_url
 
     @staticmethod
     def is_configured() -> bool:
@@ -8,9 +8,10 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
 # Default to production, but allow override for testing
 CMDRDATA_API_URL = os.getenv("CMDRDATA_API_URL", "https://api.cmdrdata.ai")
@@ -23,13 +24,32 @@ class CmdrDataSetup:
         self.api_url = api_url
         self.config_dir = Path.home() / ".cmdrdata"
         self.config_file = self.config_dir / "config.json"
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._config_stat: Optional[Tuple[int, int]] = None
+        self._session: Optional["requests.Session"] = None
+
+    @property
+    def session(self) -> "requests.Session":
+        """HTTP session reused across calls so the connection is kept alive"""
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+        return self._session
 
     def load_config(self) -> Dict[str, Any]:
         """Load existing configuration if it exists"""
-        if self.config_file.exists():
-            with open(self.config_file, "r") as f:
-                return json.load(f)
-        return {}
+        if not self.config_file.exists():
+            return {}
+
+        # Only re-read the file when its mtime or size changed since the last load
+        stat = self.config_file.stat()
+        config_stat = (stat.st_mtime_ns, stat.st_size)
+        if self._config_cache is None or config_stat != self._config_stat:
+            with open(self.config_file, "rb") as f:
+                self._config_cache = json.loads(f.read())
+            self._config_stat = config_stat
+        return dict(self._config_cache)
 
     def save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to user's home directory"""
@@ -39,6 +59,9 @@ class CmdrDataSetup:
         # Set restrictive permissions on Unix-like systems
         if os.name != "nt":
             os.chmod(self.config_file, 0o600)
+        stat = self.config_file.stat()
+        self._config_cache = dict(config)
+        self._config_stat = (stat.st_mtime_ns, stat.st_size)
 
     def register_user(self) -> Optional[Dict[str, Any]]:
         """Interactive user registration"""
@@ -62,11 +85,13 @@ class CmdrDataSetup:
                 continue
             break
 
-        # Register with API
+        # Register with API (requests is imported lazily to keep SDK imports light)
+        import requests
+
         register_data = {"email": email, "password": password, "name": name}
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/auth/register", json=register_data, timeout=10
             )
 
@@ -74,7 +99,7 @@ class CmdrDataSetup:
                 print(f"\n[OK] Account created successfully!")
 
                 # Now login to get token
-                login_response = requests.post(
+                login_response = self.session.post(
                     f"{self.api_url}/auth/login",
                     json={"email": email, "password": password},
                     timeout=10,
@@ -106,8 +131,10 @@ class CmdrDataSetup:
         email = input("Email address: ").strip()
         password = getpass.getpass("Password: ")
 
+        import requests
+
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/auth/login",
                 json={"email": email, "password": password},
                 timeout=10,
@@ -126,6 +153,7 @@ class CmdrDataSetup:
 
     def create_api_key(self, access_token: str) -> Optional[str]:
         """Create an API key for SDK usage"""
+        import requests
 
         headers = {
             "Authorization": f"Bearer {access_token}",
@@ -134,7 +162,7 @@ class CmdrDataSetup:
 
         # Check existing keys first
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_url}/user/api-keys", headers=headers, timeout=10
             )
 
@@ -154,7 +182,7 @@ class CmdrDataSetup:
         key_data = {"name": "SDK Auto-Generated Key", "permissions": ["read", "write"]}
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/user/api-keys",
                 json=key_data,
                 headers=headers,
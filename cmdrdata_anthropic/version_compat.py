@@ -4,7 +4,10 @@ Version compatibility and detection for cmdrdata-anthropic
 
 import sys
 import warnings
-from typing import Any, Dict, Optional, Tuple
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as metadata_version
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
 
 try:
     from packaging import version
@@ -40,6 +43,14 @@ except ImportError:
     version = type("Version", (), {"parse": parse})()
 
 
+# The interpreter cannot change at runtime, so check it once at import
+_PY_VERSION_STR = ".".join(map(str, sys.version_info[:3]))
+_PY_SUPPORTED = sys.version_info >= (3, 8)
+_PY_INFO: Mapping[str, Any] = MappingProxyType(
+    {"version": _PY_VERSION_STR, "supported": _PY_SUPPORTED}
+)
+
+
 class VersionCompatibility:
     """Handles version detection and compatibility warnings for Anthropic"""
 
@@ -62,44 +73,67 @@ class VersionCompatibility:
         "latest_tested": "0.38.0",
     }
 
-    def __init__(self) -> None:
-        self.anthropic_version: Optional[str] = None
-        self._check_anthropic_version()
+    # Version bounds parsed once rather than on every check
+    _MIN_VERSION = version.parse(SUPPORTED_ANTHROPIC_VERSIONS["min"])
+    _MAX_VERSION = version.parse(SUPPORTED_ANTHROPIC_VERSIONS["max"])
+    _UNTESTED_WARNING_BELOW = version.parse("0.30.0")
 
-    def _check_anthropic_version(self) -> None:
+    __slots__ = ("_detected", "_anthropic_version", "_supported")
+
+    def __init__(self) -> None:
+        # Detection is deferred until the version is first needed
+        self._detected = False
+        self._anthropic_version: Optional[str] = None
+        self._supported: Optional[bool] = None
+
+    @property
+    def anthropic_version(self) -> Optional[str]:
+        """Installed Anthropic SDK version, detected and validated on first access"""
+        if not self._detected:
+            self._anthropic_version = self._check_anthropic_version()
+            self._detected = True
+        return self._anthropic_version
+
+    @anthropic_version.setter
+    def anthropic_version(self, value: Optional[str]) -> None:
+        self._anthropic_version = value
+        self._detected = True
+        self._supported = None
+
+    def _check_anthropic_version(self) -> Optional[str]:
         """Check installed version of Anthropic SDK"""
+        # Read the version from package metadata rather than importing the SDK
         try:
-            import anthropic
-
-            self.anthropic_version = anthropic.__version__
-            self._validate_anthropic_version()
-        except ImportError:
+            installed_version = metadata_version("anthropic")
+        except PackageNotFoundError:
             warnings.warn(
                 "Anthropic SDK not found. Please install it: pip install anthropic>=0.21.0",
                 UserWarning,
                 stacklevel=3,
             )
+            return None
 
-    def _validate_anthropic_version(self) -> None:
+        self._validate_anthropic_version(installed_version)
+        return installed_version
+
+    def _validate_anthropic_version(self, installed_version: Optional[str]) -> None:
         """Validate Anthropic version and show warnings if needed"""
-        if not self.anthropic_version:
+        if not installed_version:
             return
 
-        current = version.parse(self.anthropic_version)
-        min_version = version.parse(self.SUPPORTED_ANTHROPIC_VERSIONS["min"])
-        max_version = version.parse(self.SUPPORTED_ANTHROPIC_VERSIONS["max"])
+        current = version.parse(installed_version)
 
-        if current < min_version:
+        if current < self._MIN_VERSION:
             warnings.warn(
-                f"cmdrdata-anthropic: Anthropic SDK version {self.anthropic_version} is below minimum "
+                f"cmdrdata-anthropic: Anthropic SDK version {installed_version} is below minimum "
                 f"supported version {self.SUPPORTED_ANTHROPIC_VERSIONS['min']}. "
                 f"Please upgrade: pip install anthropic>={self.SUPPORTED_ANTHROPIC_VERSIONS['min']}",
                 UserWarning,
                 stacklevel=3,
             )
-        elif current >= max_version:
+        elif current >= self._MAX_VERSION:
             warnings.warn(
-                f"cmdrdata-anthropic: Anthropic SDK version {self.anthropic_version} is newer than tested version. "
+                f"cmdrdata-anthropic: Anthropic SDK version {installed_version} is newer than tested version. "
                 f"cmdrdata-anthropic was tested up to version {self.SUPPORTED_ANTHROPIC_VERSIONS['latest_tested']}. "
                 f"Functionality may be limited. Please check for cmdrdata-anthropic updates.",
                 UserWarning,
@@ -107,11 +141,11 @@ class VersionCompatibility:
             )
         # Only warn for significantly older untested versions, not newer ones
         elif (
-            current < version.parse("0.30.0")
+            current < self._UNTESTED_WARNING_BELOW
             and str(current) not in self.SUPPORTED_ANTHROPIC_VERSIONS["tested"]
         ):
             warnings.warn(
-                f"cmdrdata-anthropic: Anthropic SDK version {self.anthropic_version} has not been fully tested. "
+                f"cmdrdata-anthropic: Anthropic SDK version {installed_version} has not been fully tested. "
                 f"Latest tested version: {self.SUPPORTED_ANTHROPIC_VERSIONS['latest_tested']}. "
                 f"Consider upgrading for best compatibility.",
                 UserWarning,
@@ -119,35 +153,49 @@ class VersionCompatibility:
             )
 
     def is_anthropic_supported(self) -> bool:
-        """Check if Anthropic version is supported"""
-        if not self.anthropic_version:
-            return False
-
-        current = version.parse(self.anthropic_version)
-        min_version = version.parse(self.SUPPORTED_ANTHROPIC_VERSIONS["min"])
-        max_version = version.parse(self.SUPPORTED_ANTHROPIC_VERSIONS["max"])
-
-        return bool(min_version <= current < max_version)
-
-    def get_compatibility_info(self) -> Dict[str, Any]:
-        """Get comprehensive compatibility information"""
-        return {
-            "anthropic": {
-                "installed": self.anthropic_version,
-                "supported": self.is_anthropic_supported(),
-                "min_supported": self.SUPPORTED_ANTHROPIC_VERSIONS["min"],
-                "max_supported": self.SUPPORTED_ANTHROPIC_VERSIONS["max"],
-                "tested_versions": self.SUPPORTED_ANTHROPIC_VERSIONS["tested"],
-            },
-            "python": {
-                "version": f"{sys.version_info[0]}.{sys.version_info[1]}.{sys.version_info[2]}",
-                "supported": sys.version_info >= (3, 8),
-            },
-        }
-
-
-# Global instance
-_version_compat = VersionCompatibility()
+        """Check if Anthropic version is supported (computed once per instance)"""
+        if self._supported is None:
+            if not self.anthropic_version:
+                self._supported = False
+            else:
+                current = version.parse(self.anthropic_version)
+                self._supported = bool(self._MIN_VERSION <= current < self._MAX_VERSION)
+        return self._supported
+
+    def get_compatibility_info(self) -> Mapping[str, Any]:
+        """
+        Get comprehensive compatibility information as a read-only mapping of
+        read-only sections; tested_versions is a tuple
+        """
+        return MappingProxyType(
+            {
+                "anthropic": MappingProxyType(
+                    {
+                        "installed": self.anthropic_version,
+                        "supported": self.is_anthropic_supported(),
+                        "min_supported": self.SUPPORTED_ANTHROPIC_VERSIONS["min"],
+                        "max_supported": self.SUPPORTED_ANTHROPIC_VERSIONS["max"],
+                        "tested_versions": tuple(
+                            self.SUPPORTED_ANTHROPIC_VERSIONS["tested"]
+                        ),
+                    }
+                ),
+                "python": _PY_INFO,
+            }
+        )
+
+
+# Global instance, created on first use so the version is parsed once per process
+_version_compat: Optional[VersionCompatibility] = None
+_compatibility_info: Optional[Mapping[str, Any]] = None
+
+
+def _get_instance() -> VersionCompatibility:
+    """Return the shared VersionCompatibility instance, creating it if needed"""
+    global _version_compat
+    if _version_compat is None:
+        _version_compat = VersionCompatibility()
+    return _version_compat
 
 
 def check_compatibility() -> bool:
@@ -157,14 +205,20 @@ def check_compatibility() -> bool:
     Returns:
         True if compatible, False otherwise
     """
-    return _version_compat.is_anthropic_supported()
+    return _get_instance().is_anthropic_supported()
 
 
-def get_compatibility_info() -> Dict[str, Any]:
+def get_compatibility_info() -> Mapping[str, Any]:
     """
     Get detailed compatibility information.
 
     Returns:
-        Dictionary with compatibility details
+        Read-only mapping with compatibility details, built once and shared
+        between calls. The "anthropic" and "python" sections are read-only
+        mappings too, so json.dumps() needs plain dicts, e.g.
+        {name: dict(section) for name, section in info.items()}
     """
-    return _version_compat.get_compatibility_info()
+    global _compatibility_info
+    if _compatibility_info is None:
+        _compatibility_info = _get_instance().get_compatibility_info()
+    return _compatibility_info
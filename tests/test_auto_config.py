@@ -0,0 +1,238 @@
+"""
+Tests for CmdrData auto-configuration loading
+"""
+
+import copy
+import dataclasses
+import json
+import os
+import pickle
+
+import pytest
+
+from cmdrdata_anthropic.auto_config import AutoConfig, CmdrDataConfig
+
+
+@pytest.fixture
+def config_env(tmp_path, monkeypatch):
+    """Isolate config lookup in an empty working and home directory"""
+    home = tmp_path / "home"
+    home.mkdir()
+    project = tmp_path / "project"
+    project.mkdir()
+
+    monkeypatch.setattr(
+        "cmdrdata_anthropic.auto_config._HOME_CONFIG_PATH",
+        home / ".cmdrdata" / "config.json",
+    )
+    monkeypatch.delenv("CMDRDATA_API_KEY", raising=False)
+    monkeypatch.delenv("CMDRDATA_API_URL", raising=False)
+    monkeypatch.chdir(project)
+
+    AutoConfig.refresh_cache()
+    yield home, project
+    AutoConfig.refresh_cache()
+
+
+class TestAutoConfig:
+    def test_defaults_when_unconfigured(self, config_env):
+        """Test defaults when no source provides an API key"""
+        config = AutoConfig.load_config()
+
+        assert config == CmdrDataConfig(api_key=None, api_url="https://api.cmdrdata.ai")
+        assert not AutoConfig.is_configured()
+
+    def test_environment_takes_priority(self, config_env, monkeypatch):
+        """Test environment variables override config files"""
+        _, project = config_env
+        (project / ".env").write_text("CMDRDATA_API_KEY=from-dotenv\n")
+        monkeypatch.setenv("CMDRDATA_API_KEY", "from-env")
+        monkeypatch.setenv("CMDRDATA_API_URL", "https://env.example.com")
+
+        assert AutoConfig.get_api_key() == "from-env"
+        assert AutoConfig.get_api_url() == "https://env.example.com"
+
+    def test_environment_key_skips_files(self, config_env, monkeypatch):
+        """Test no config file is touched when the key is set in the environment"""
+        monkeypatch.setenv("CMDRDATA_API_KEY", "from-env")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("config files should not be accessed")
+
+        monkeypatch.setattr("pathlib.Path.stat", fail)
+        monkeypatch.setattr("pathlib.Path.exists", fail)
+
+        assert AutoConfig.get_api_key() == "from-env"
+        assert AutoConfig.get_api_url() == "https://api.cmdrdata.ai"
+
+    def test_dotenv_key_stops_lookup(self, config_env):
+        """Test lower priority files are ignored once .env provides the key"""
+        home, project = config_env
+        (project / ".env").write_text("CMDRDATA_API_KEY=from-dotenv\n")
+        (home / ".cmdrdata").mkdir()
+        (home / ".cmdrdata" / "config.json").write_text(
+            json.dumps({"api_key": "from-home", "api_url": "https://home.example.com"})
+        )
+
+        assert AutoConfig.get_api_key() == "from-dotenv"
+        assert AutoConfig.get_api_url() == "https://api.cmdrdata.ai"
+
+    def test_dotenv_file(self, config_env):
+        """Test loading key and URL from .env in the working directory"""
+        _, project = config_env
+        (project / ".env").write_text(
+            "# comment\n"
+            "OTHER=value\n"
+            "CMDRDATA_API_KEY=from-dotenv\n"
+            "CMDRDATA_API_URL=https://dotenv.example.com\n"
+        )
+
+        assert AutoConfig.get_api_key() == "from-dotenv"
+        assert AutoConfig.get_api_url() == "https://dotenv.example.com"
+
+    def test_dotenv_crlf_and_repeated_keys(self, config_env):
+        """Test CRLF line endings are stripped and the last entry wins"""
+        _, project = config_env
+        (project / ".env").write_bytes(
+            b"CMDRDATA_API_KEY=first\r\n"
+            b"NOT_CMDRDATA_API_KEY=ignored\r\n"
+            b"CMDRDATA_API_KEY= second \r\n"
+        )
+
+        assert AutoConfig.get_api_key() == "second"
+
+    def test_dotenv_cr_only_line_endings(self, config_env):
+        """Test a lone CR ends a line, as with universal newlines"""
+        _, project = config_env
+        (project / ".env").write_bytes(
+            b"CMDRDATA_API_KEY=abc\rCMDRDATA_API_URL=http://x\r"
+        )
+
+        assert AutoConfig.get_api_key() == "abc"
+        assert AutoConfig.get_api_url() == "http://x"
+
+    def test_home_config(self, config_env):
+        """Test loading from ~/.cmdrdata/config.json"""
+        home, _ = config_env
+        (home / ".cmdrdata").mkdir()
+        (home / ".cmdrdata" / "config.json").write_text(
+            json.dumps({"api_key": "from-home", "api_url": "https://home.example.com"})
+        )
+
+        assert AutoConfig.get_api_key() == "from-home"
+        assert AutoConfig.get_api_url() == "https://home.example.com"
+
+    def test_project_config(self, config_env):
+        """Test loading from .cmdrdata.json in the working directory"""
+        _, project = config_env
+        (project / ".cmdrdata.json").write_text(json.dumps({"api_key": "from-project"}))
+
+        assert AutoConfig.get_api_key() == "from-project"
+        assert AutoConfig.get_api_url() == "https://api.cmdrdata.ai"
+
+    def test_invalid_json_is_ignored(self, config_env):
+        """Test malformed config files do not raise"""
+        _, project = config_env
+        (project / ".cmdrdata.json").write_text("{not json")
+
+        assert AutoConfig.get_api_key() is None
+
+    def test_non_object_json_is_ignored(self, config_env):
+        """Test config files holding a non-object JSON value do not raise"""
+        home, project = config_env
+        (home / ".cmdrdata").mkdir()
+        (home / ".cmdrdata" / "config.json").write_text('["api_key"]')
+        (project / ".cmdrdata.json").write_text(json.dumps({"api_key": "project"}))
+
+        assert AutoConfig.get_api_key() == "project"
+
+    def test_unreadable_dotenv_is_ignored(self, config_env):
+        """Test a .env path that cannot be read as a file is skipped"""
+        _, project = config_env
+        (project / ".env").mkdir()
+
+        assert AutoConfig.get_api_key() is None
+
+    def test_load_config_is_cached(self, config_env, monkeypatch):
+        """Test unchanged sources are not re-read"""
+        _, project = config_env
+        (project / ".cmdrdata.json").write_text(json.dumps({"api_key": "cached"}))
+
+        assert AutoConfig.get_api_key() == "cached"
+
+        def fail(*args, **kwargs):
+            raise AssertionError("config should have been served from cache")
+
+        monkeypatch.setattr("cmdrdata_anthropic.auto_config._read_config", fail)
+        assert AutoConfig.get_api_key() == "cached"
+        assert AutoConfig.is_configured()
+
+    def test_load_config_is_immutable(self, config_env):
+        """Test the shared cached config cannot be modified by callers"""
+        config = AutoConfig.load_config()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.api_key = "mutated"
+        assert AutoConfig.load_config() is config
+        assert AutoConfig.get_api_key() is None
+
+    def test_load_config_copies_and_pickles(self, config_env, monkeypatch):
+        """Test the returned config survives copy, deepcopy and pickling"""
+        monkeypatch.setenv("CMDRDATA_API_KEY", "from-env")
+        config = AutoConfig.load_config()
+
+        assert copy.copy(config) == config
+        assert copy.deepcopy(config) == config
+        assert pickle.loads(pickle.dumps(config)) == config
+
+    def test_cache_invalidated_on_file_change(self, config_env):
+        """Test edited config files are picked up without a manual refresh"""
+        _, project = config_env
+        config_file = project / ".cmdrdata.json"
+        config_file.write_text(json.dumps({"api_key": "old"}))
+        assert AutoConfig.get_api_key() == "old"
+
+        config_file.write_text(json.dumps({"api_key": "new-key"}))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert AutoConfig.get_api_key() == "new-key"
+
+    def test_cache_invalidated_on_directory_change(self, config_env, monkeypatch):
+        """Test changing directory re-reads a project config with identical stats"""
+        _, project = config_env
+        first, second = project / "a", project / "b"
+        for directory, key in ((first, "key-AAAA"), (second, "key-BBBB")):
+            directory.mkdir()
+            config_file = directory / ".cmdrdata.json"
+            config_file.write_text(json.dumps({"api_key": key}))
+            os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+
+        monkeypatch.chdir(first)
+        assert AutoConfig.get_api_key() == "key-AAAA"
+
+        monkeypatch.chdir(second)
+        assert AutoConfig.get_api_key() == "key-BBBB"
+
+    def test_cache_invalidated_on_env_change(self, config_env, monkeypatch):
+        """Test environment variable changes are picked up"""
+        assert AutoConfig.get_api_key() is None
+
+        monkeypatch.setenv("CMDRDATA_API_KEY", "late-key")
+
+        assert AutoConfig.get_api_key() == "late-key"
+
+    def test_refresh_cache(self, config_env, monkeypatch):
+        """Test refresh_cache forces the next lookup to re-read sources"""
+        AutoConfig.get_api_key()
+        calls = []
+
+        def read_config():
+            calls.append(1)
+            return {"api_key": "refreshed", "api_url": "https://api.cmdrdata.ai"}
+
+        monkeypatch.setattr("cmdrdata_anthropic.auto_config._read_config", read_config)
+        AutoConfig.refresh_cache()
+
+        assert AutoConfig.get_api_key() == "refreshed"
+        assert calls == [1]
@@ -2,6 +2,7 @@
 Basic integration tests for cmdrdata-anthropic
 """
 
+from collections.abc import Mapping
 from unittest.mock import Mock, patch
 
 import pytest
@@ -90,7 +91,7 @@ class TestBasicFunctionality:
         assert isinstance(compat, bool)
 
         info = get_compatibility_info()
-        assert isinstance(info, dict)
+        assert isinstance(info, Mapping)
         assert "anthropic" in info
         assert "python" in info
 
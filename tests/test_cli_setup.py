@@ -0,0 +1,144 @@
+"""
+Tests for the CmdrData CLI setup wizard
+"""
+
+import json
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+from cmdrdata_anthropic.cli_setup import CmdrDataSetup
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.text = json.dumps(payload)
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class RecordingSession:
+    """Stand-in for requests.Session that records every request it sends"""
+
+    instances = []
+
+    def __init__(self):
+        self.calls = []
+        RecordingSession.instances.append(self)
+
+    def get(self, url, **kwargs):
+        self.calls.append(("GET", url))
+        return FakeResponse(200, {"api_keys": []})
+
+    def post(self, url, **kwargs):
+        self.calls.append(("POST", url))
+        return FakeResponse(200, {"key": "new-sdk-key"})
+
+
+@pytest.fixture
+def fake_requests(monkeypatch):
+    """Install a fake requests module whose Session records its calls"""
+    RecordingSession.instances = []
+    module = types.ModuleType("requests")
+    module.Session = RecordingSession
+    module.RequestException = type("RequestException", (Exception,), {})
+    monkeypatch.setitem(sys.modules, "requests", module)
+    return module
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    """Setup wizard writing to a temporary home directory"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return CmdrDataSetup("http://localhost:8000")
+
+
+class TestCmdrDataSetupConfig:
+    def test_load_config_missing(self, setup):
+        """Test loading when no config file exists"""
+        assert setup.load_config() == {}
+        assert setup.get_api_key() is None
+
+    def test_save_and_load_config(self, setup):
+        """Test saved configuration round-trips through the config file"""
+        setup.save_config({"api_key": "saved-key", "api_url": setup.api_url})
+
+        assert json.loads(setup.config_file.read_text())["api_key"] == "saved-key"
+        assert setup.load_config()["api_key"] == "saved-key"
+        assert setup.get_api_key() == "saved-key"
+
+    def test_load_config_is_cached(self, setup, monkeypatch):
+        """Test an unchanged config file is not re-read"""
+        setup.save_config({"api_key": "saved-key"})
+
+        def fail(*args, **kwargs):
+            raise AssertionError("config should have been served from cache")
+
+        monkeypatch.setattr("cmdrdata_anthropic.cli_setup.open", fail, raising=False)
+        assert setup.get_api_key() == "saved-key"
+
+    def test_load_config_picks_up_external_edits(self, setup):
+        """Test a config file modified outside the wizard is re-read"""
+        setup.save_config({"api_key": "old"})
+        assert setup.get_api_key() == "old"
+
+        setup.config_file.write_text(json.dumps({"api_key": "new-key"}))
+        stat = setup.config_file.stat()
+        os.utime(setup.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert setup.get_api_key() == "new-key"
+
+    def test_load_config_returns_copy(self, setup):
+        """Test mutating the returned dict does not corrupt the cache"""
+        setup.save_config({"api_key": "saved-key"})
+        setup.load_config()["api_key"] = "mutated"
+
+        assert setup.get_api_key() == "saved-key"
+
+
+# Records any attempt to import requests, whether or not it is installed
+IMPORT_GUARD = """
+import sys
+
+attempts = []
+
+
+class RecordRequestsImport:
+    def find_spec(self, name, path=None, target=None):
+        if name == "requests" or name.startswith("requests."):
+            attempts.append(name)
+        return None
+
+
+sys.meta_path.insert(0, RecordRequestsImport())
+import cmdrdata_anthropic.cli_setup
+
+assert not attempts, attempts
+assert "requests" not in sys.modules
+"""
+
+
+class TestCmdrDataSetupHttp:
+    def test_import_does_not_load_requests(self):
+        """Test importing the setup wizard does not import requests"""
+        subprocess.run([sys.executable, "-c", IMPORT_GUARD], check=True)
+
+    def test_create_api_key_reuses_session(self, setup, fake_requests):
+        """Test the key lookup and creation share one HTTP session"""
+        assert setup.create_api_key("token") == "new-sdk-key"
+
+        assert len(RecordingSession.instances) == 1
+        session = RecordingSession.instances[0]
+        assert setup._session is session
+        assert session.calls == [
+            ("GET", "http://localhost:8000/user/api-keys"),
+            ("POST", "http://localhost:8000/user/api-keys"),
+        ]
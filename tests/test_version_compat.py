@@ -2,11 +2,11 @@
 Tests for Anthropic version compatibility detection
 """
 
-import sys
-import warnings
-from unittest.mock import Mock, patch
+import json
+from importlib.metadata import PackageNotFoundError
 
 import pytest
+from packaging.version import parse as parse_version
 
 from cmdrdata_anthropic.version_compat import (
     VersionCompatibility,
@@ -14,68 +14,124 @@ from cmdrdata_anthropic.version_compat import (
     get_compatibility_info,
 )
 
+METADATA_VERSION = "cmdrdata_anthropic.version_compat.metadata_version"
+
+
+def installed(version_string):
+    """Stand-in for importlib.metadata.version reporting a fixed version"""
+
+    def fake_metadata_version(distribution):
+        return version_string
+
+    return fake_metadata_version
+
+
+@pytest.fixture(
+    params=[
+        ("0.25.0", True, None),
+        ("0.29.0", True, "has not been fully tested"),
+        ("0.20.0", False, "below minimum"),
+        ("1.2.0", False, "newer than tested"),
+    ],
+    ids=["supported", "untested", "too-old", "too-new"],
+)
+def fake_version(request, monkeypatch):
+    """Patch the installed Anthropic version; returns (version, supported, warning)"""
+    version_string, supported, expected_warning = request.param
+    monkeypatch.setattr(METADATA_VERSION, installed(version_string))
+    return version_string, supported, expected_warning
+
 
 class TestVersionCompatibility:
+    @pytest.mark.filterwarnings("ignore::UserWarning")
     def test_anthropic_version_detection(self):
         """Test detection of installed Anthropic version"""
         compat = VersionCompatibility()
 
-        # Should detect some version (or warn if not installed)
-        assert compat.anthropic_version is not None or len(warnings.filters) > 0
+        # Either no SDK is installed, or its version is a parseable string
+        assert isinstance(compat.anthropic_version, (str, type(None)))
+        if compat.anthropic_version is not None:
+            parse_version(compat.anthropic_version)
+
+    def test_detection_is_deferred_until_first_use(self, monkeypatch):
+        """Test construction neither looks up the version nor warns"""
+        lookups = []
+
+        def fake_metadata_version(distribution):
+            lookups.append(distribution)
+            return "0.20.0"
+
+        monkeypatch.setattr(METADATA_VERSION, fake_metadata_version)
 
-    def test_supported_anthropic_version(self):
-        """Test that supported versions are marked as compatible"""
-        with patch("anthropic.__version__", "0.25.0"):
+        with pytest.warns(UserWarning, match="below minimum") as record:
             compat = VersionCompatibility()
-            assert compat.is_anthropic_supported()
-
-    def test_unsupported_anthropic_version(self):
-        """Test handling of unsupported Anthropic versions"""
-        with patch("cmdrdata_anthropic.version_compat.version") as mock_version:
-            # Mock an unsupported (too old) version
-            mock_parse = Mock()
-            mock_old_version = Mock()
-            mock_old_version.__lt__ = Mock(return_value=True)
-            mock_old_version.__ge__ = Mock(return_value=False)
-            mock_parse.return_value = mock_old_version
-            mock_version.parse = mock_parse
-
-            with patch("anthropic.__version__", "0.20.0"):
-                with warnings.catch_warnings(record=True) as w:
-                    warnings.simplefilter("always")
-                    compat = VersionCompatibility()
-                    assert not compat.is_anthropic_supported()
-                    assert len(w) > 0
-                    assert "below minimum" in str(w[0].message)
-
-    def test_missing_anthropic(self):
+            assert len(record) == 0
+            assert lookups == []
+
+            assert not compat.is_anthropic_supported()
+            assert not compat.is_anthropic_supported()
+
+        assert len(record) == 1
+        assert lookups == ["anthropic"]
+
+    def test_version_support_and_warnings(self, fake_version, recwarn):
+        """Test support detection and warnings across version ranges"""
+        installed, supported, expected_warning = fake_version
+
+        compat = VersionCompatibility()
+        assert compat.anthropic_version == installed
+        assert compat.is_anthropic_supported() is supported
+
+        messages = [str(warning.message) for warning in recwarn]
+        if expected_warning is None:
+            assert messages == []
+        else:
+            assert len(messages) == 1
+            assert expected_warning in messages[0]
+
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    def test_support_check_is_cached(self, fake_version, monkeypatch):
+        """Test repeated support checks do not re-parse the installed version"""
+        _, supported, _ = fake_version
+        compat = VersionCompatibility()
+        assert compat.is_anthropic_supported() is supported
+
+        def fail(version_string):
+            raise AssertionError("version should not be re-parsed")
+
+        monkeypatch.setattr("cmdrdata_anthropic.version_compat.version.parse", fail)
+        assert compat.is_anthropic_supported() is supported
+        assert compat.is_anthropic_supported() is supported
+
+    def test_instances_have_no_dict(self):
+        """Test VersionCompatibility uses __slots__ instead of a per-instance dict"""
+        compat = VersionCompatibility()
+
+        assert not hasattr(compat, "__dict__")
+        with pytest.raises(AttributeError):
+            compat.unexpected_attribute = True
+
+    def test_anthropic_version_override(self, recwarn):
+        """Test assigning anthropic_version skips detection and resets support"""
+        compat = VersionCompatibility()
+        compat.anthropic_version = "0.25.0"
+        assert compat.is_anthropic_supported()
+
+        compat.anthropic_version = None
+        assert not compat.is_anthropic_supported()
+        assert len(recwarn) == 0
+
+    def test_missing_anthropic(self, monkeypatch):
         """Test handling when Anthropic SDK is not installed"""
-        with patch.dict("sys.modules", {"anthropic": None}):
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                compat = VersionCompatibility()
-                assert not compat.is_anthropic_supported()
-                assert len(w) > 0
-                assert "not found" in str(w[0].message)
-
-    def test_version_warnings(self):
-        """Test version compatibility warnings"""
-        with patch("cmdrdata_anthropic.version_compat.version") as mock_version:
-            # Mock a newer untested version
-            mock_parse = Mock()
-            mock_new_version = Mock()
-            mock_new_version.__lt__ = Mock(return_value=False)
-            mock_new_version.__ge__ = Mock(return_value=True)
-            mock_new_version.__str__ = Mock(return_value="0.99.0")
-            mock_parse.return_value = mock_new_version
-            mock_version.parse = mock_parse
-
-            with patch("anthropic.__version__", "0.99.0"):
-                with warnings.catch_warnings(record=True) as w:
-                    warnings.simplefilter("always")
-                    compat = VersionCompatibility()
-                    assert len(w) > 0
-                    assert "newer than tested" in str(w[0].message)
+
+        def fake_metadata_version(distribution):
+            raise PackageNotFoundError(distribution)
+
+        monkeypatch.setattr(METADATA_VERSION, fake_metadata_version)
+
+        with pytest.warns(UserWarning, match="not found"):
+            compat = VersionCompatibility()
+            assert not compat.is_anthropic_supported()
 
     def test_get_compatibility_info(self):
         """Test compatibility information retrieval"""
@@ -84,13 +140,60 @@ class TestVersionCompatibility:
         assert "anthropic" in info
         assert "python" in info
         assert "version" in info["python"]
-        assert info["python"]["supported"] == (sys.version_info >= (3, 8))
+        # The package requires Python >= 3.9, so this is always supported
+        assert info["python"]["supported"] is True
+
+    def test_get_compatibility_info_is_frozen(self):
+        """Test the shared compatibility info is built once and read-only"""
+        info = get_compatibility_info()
+
+        assert get_compatibility_info() is info
+        with pytest.raises(TypeError):
+            info["anthropic"] = {}
+        with pytest.raises(TypeError):
+            info["python"]["supported"] = False
+        assert isinstance(info["anthropic"]["tested_versions"], tuple)
+
+    def test_get_compatibility_info_serializes_as_dicts(self):
+        """Test the documented plain-dict copy of the shared info is JSON-ready"""
+        info = get_compatibility_info()
+        plain = {name: dict(section) for name, section in info.items()}
+
+        assert json.loads(json.dumps(plain))["python"] == dict(info["python"])
+        plain["anthropic"]["supported"] = "mutated"
+        assert info["anthropic"]["supported"] != "mutated"
 
     def test_check_compatibility_function(self):
         """Test standalone compatibility check function"""
         result = check_compatibility()
         assert isinstance(result, bool)
 
+    def test_module_functions_share_instance(self, monkeypatch):
+        """Test the module-level helpers reuse a single cached instance"""
+        created = []
+
+        class CountingCompatibility(VersionCompatibility):
+            __slots__ = ()
+
+            def __init__(self):
+                created.append(self)
+                super().__init__()
+
+        monkeypatch.setattr(
+            "cmdrdata_anthropic.version_compat.VersionCompatibility",
+            CountingCompatibility,
+        )
+        monkeypatch.setattr("cmdrdata_anthropic.version_compat._version_compat", None)
+        monkeypatch.setattr(
+            "cmdrdata_anthropic.version_compat._compatibility_info", None
+        )
+
+        check_compatibility()
+        check_compatibility()
+        get_compatibility_info()
+
+        assert len(created) == 1
+
     def test_fake_version_class(self):
         """Test the FakeVersion fallback class when packaging is not available"""
         # Temporarily hide the packaging module
@@ -137,24 +240,9 @@ class TestVersionCompatibility:
             sys.modules.update(original_modules)
             importlib.reload(cmdrdata_anthropic.version_compat)
 
-    def test_validate_version_none(self):
+    def test_validate_version_none(self, recwarn):
         """Test _validate_anthropic_version with None version"""
         compat = VersionCompatibility()
-        compat.anthropic_version = None
         # Should return early without warnings
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            compat._validate_anthropic_version()
-            assert len(w) == 0
-
-    def test_older_untested_version_warning(self):
-        """Test warning for older untested versions"""
-        with patch("anthropic.__version__", "0.29.0"):
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                compat = VersionCompatibility()
-                # Check if warning was issued for untested version
-                warning_found = any(
-                    "has not been fully tested" in str(warning.message) for warning in w
-                )
-                assert warning_found
+        compat._validate_anthropic_version(None)
+        assert len(recwarn) == 0